@@ -2,7 +2,7 @@
 
 __version__ = "0.1.0"
 
-from air.client import AIRClient
+from air.client import AIRClient, AuditChainError, AuditIndex
 from air.wrapper import air_wrap
 
-__all__ = ["AIRClient", "air_wrap", "__version__"]
+__all__ = ["AIRClient", "AuditChainError", "AuditIndex", "air_wrap", "__version__"]
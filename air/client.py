@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import httpx
 
@@ -29,6 +29,106 @@ class AIRConfig:
         )
 
 
+class AuditChainError(Exception):
+    """Raised when fetched audit entries do not extend the verified chain."""
+
+
+def _verify_entries(entries: list[dict], last_index: int,
+                    head_hash: str) -> tuple[int, str]:
+    """Check that entries extend the chain at (last_index, head_hash).
+
+    Returns the new cursor. Nothing is mutated, so callers can verify
+    several pages against a scratch cursor before committing.
+    """
+    for entry in entries:
+        index = entry.get("index") if isinstance(entry, dict) else None
+        entry_hash = entry.get("hash") if isinstance(entry, dict) else None
+        if (not isinstance(index, int) or isinstance(index, bool)
+                or not isinstance(entry_hash, str) or not entry_hash):
+            raise AuditChainError(
+                f"Malformed audit entry after index {last_index}: "
+                "missing integer 'index' or string 'hash'"
+            )
+        if index != last_index + 1:
+            raise AuditChainError(
+                f"Audit chain gap: expected index {last_index + 1}, "
+                f"got {index}"
+            )
+        if last_index >= 0 and entry.get("prev_hash") != head_hash:
+            raise AuditChainError(
+                f"Audit chain broken at index {index}: prev_hash does "
+                "not match verified head"
+            )
+        last_index, head_hash = index, entry_hash
+    return last_index, head_hash
+
+
+def _retry_after(resp: httpx.Response) -> float:
+    """Seconds requested by a ``Retry-After`` header, or 0 if absent."""
+    try:
+        return max(float(resp.headers.get("retry-after", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+@dataclass
+class AuditIndex:
+    """Compact local index of verified audit entries.
+
+    ``last_index`` and ``head_hash`` form the cursor: the position and hash
+    of the newest verified entry. Seed both from a previous run to resume
+    polling without re-fetching history; without a cursor the chain must
+    start at index 0.
+
+    ``hashes`` is a best-effort, process-local cache of the last ``window``
+    verified hashes. ``len()`` and ``in`` only cover entries seen by this
+    process within that window, not the full chain.
+    """
+
+    last_index: int = -1
+    head_hash: str = ""
+    window: int = 1024
+    hashes: dict[int, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.last_index < -1:
+            raise ValueError("last_index must be -1 (no cursor) or >= 0")
+        if self.last_index >= 0 and not self.head_hash:
+            raise ValueError("A seeded cursor needs both last_index "
+                             "and head_hash")
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __contains__(self, index: object) -> bool:
+        return index in self.hashes
+
+    def extend(self, entries: list[dict]) -> None:
+        """Verify entries against the chain head and append them.
+
+        Each entry must carry the next chain ``index`` and a ``prev_hash``
+        equal to the current head. The index is only updated once the whole
+        batch verifies.
+        """
+        _verify_entries(entries, self.last_index, self.head_hash)
+        self._commit(entries)
+
+    def _commit(self, entries: list[dict]) -> None:
+        """Advance the cursor over already-verified entries."""
+        if not entries:
+            return
+        for entry in entries[-self.window:] if self.window > 0 else []:
+            self.hashes[entry["index"]] = entry["hash"]
+        self.last_index = entries[-1]["index"]
+        self.head_hash = entries[-1]["hash"]
+        # Entries are inserted in chain order, so the oldest come first
+        while self.hashes:
+            oldest = next(iter(self.hashes))
+            if oldest > self.last_index - self.window:
+                break
+            del self.hashes[oldest]
+
+
 class AIRClient:
     """HTTP client that talks to the AIR Blackbox Gateway.
 
@@ -44,6 +144,7 @@ class AIRClient:
             timeout=self.config.timeout,
             verify=self.config.verify_ssl,
         )
+        self.audit_index = AuditIndex()
 
     def chat(self, messages: list[dict], model: str = "gpt-4o-mini",
              **kwargs: Any) -> dict:
@@ -79,6 +180,121 @@ class AIRClient:
         resp.raise_for_status()
         return resp.json()
 
+    def _audit_pages(self, gateway_key: str, limit: int,
+                     wait: float) -> Iterator[list[dict]]:
+        """Yield verified, non-empty pages of entries after ``audit_index``.
+
+        Pages are checked against a scratch cursor and are not committed;
+        callers advance ``audit_index`` once entries are delivered. The next
+        page is only requested after the previous one has been consumed.
+        """
+        headers = {}
+        if gateway_key:
+            headers["X-Gateway-Key"] = gateway_key
+        last_index = self.audit_index.last_index
+        head_hash = self.audit_index.head_hash
+        first = True
+        while True:
+            params: dict[str, Any] = {"limit": limit}
+            if last_index >= 0:
+                params["after"] = last_index
+            if wait and first:
+                params["wait"] = wait
+            resp = self._http.get("/v1/audit/entries", params=params,
+                                  headers=headers,
+                                  timeout=self.config.timeout + wait)
+            resp.raise_for_status()
+            try:
+                payload = resp.json()
+            except ValueError as exc:
+                raise AuditChainError(
+                    "Malformed audit response: body is not JSON") from exc
+            entries = (payload.get("entries", [])
+                       if isinstance(payload, dict) else None)
+            if not isinstance(entries, list):
+                raise AuditChainError(
+                    "Malformed audit response: expected an object with an "
+                    "'entries' list")
+            last_index, head_hash = _verify_entries(
+                entries, last_index, head_hash)
+            first = False
+            if entries:
+                yield entries
+            if len(entries) < limit:
+                return
+
+    def audit_since(self, gateway_key: str = "", limit: int = 500,
+                    wait: float = 0.0) -> list[dict]:
+        """Fetch and verify audit entries newer than ``audit_index``.
+
+        Only entries after the cursor are requested, so each call costs
+        O(new entries); the first call without a seeded cursor downloads
+        the full history. Pass ``wait`` (seconds) to long-poll the gateway
+        when nothing new is available yet.
+
+        Requires a gateway serving ``GET /v1/audit/entries`` with ``after``,
+        ``limit`` and ``wait`` query params, returning
+        ``{"entries": [{"index", "hash", "prev_hash", ...}]}`` in chain
+        order. Each page advances ``audit_index`` once it verifies. If a
+        later page fails, the verified prefix is returned and the error
+        surfaces on the next call; a failing first page raises with the
+        cursor unchanged.
+        """
+        new: list[dict] = []
+        try:
+            for entries in self._audit_pages(gateway_key, limit, wait):
+                self.audit_index._commit(entries)
+                new.extend(entries)
+        except (httpx.HTTPError, AuditChainError):
+            if not new:
+                raise
+        return new
+
+    def watch(self, gateway_key: str = "", poll_interval: float = 1.0,
+              max_interval: float = 30.0, wait: float = 0.0,
+              limit: int = 500) -> Iterator[dict]:
+        """Yield new audit entries as they are appended to the chain.
+
+        Each entry is committed to ``audit_index`` just before it is
+        yielded, so stopping early never skips undelivered entries.
+
+        With ``wait`` set, the gateway holds each request open, so an empty
+        response is re-polled immediately unless it came back in under half
+        of ``wait``. Otherwise, and whenever the gateway is unreachable or
+        returns 429 or 5xx, polling backs off exponentially
+        (``poll_interval`` doubling up to ``max_interval``, or longer if
+        ``Retry-After`` asks for it). Chain errors and other 4xx responses
+        are raised.
+        """
+        interval = poll_interval
+        while True:
+            delay = interval
+            failed = delivered = False
+            started = time.monotonic()
+            try:
+                for entries in self._audit_pages(gateway_key, limit, wait):
+                    for entry in entries:
+                        self.audit_index._commit([entry])
+                        delivered = True
+                        yield entry
+            except httpx.TransportError:
+                failed = True
+            except httpx.HTTPStatusError as exc:
+                status = exc.response.status_code
+                if status != 429 and status < 500:
+                    raise
+                failed = True
+                delay = max(interval, _retry_after(exc.response))
+            if failed:
+                time.sleep(delay)
+                interval = min(interval * 2, max_interval)
+            elif delivered or (
+                    wait and time.monotonic() - started >= wait / 2):
+                interval = poll_interval
+            else:
+                time.sleep(interval)
+                interval = min(interval * 2, max_interval)
+
     def export_evidence(self, gateway_key: str = "") -> dict:
         """Export signed evidence package."""
         headers = {}
@@ -1,10 +1,12 @@
 """Tests for AIR SDK core client."""
 
+import itertools
 import json
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock
 
-from air.client import AIRClient, AIRConfig
+from air.client import AIRClient, AIRConfig, AuditChainError, AuditIndex
 
 
 class TestAIRConfig:
@@ -90,3 +92,216 @@ class TestAIRClient:
         assert call_args[1]["headers"]["X-Gateway-Key"] == "secret"
         assert result["chain_length"] == 42
         client.close()
+
+
+def _chain(start, stop):
+    return [
+        {"index": i, "hash": f"h{i}",
+         **({"prev_hash": f"h{i - 1}"} if i else {})}
+        for i in range(start, stop)
+    ]
+
+
+def _gateway_client(pages, index=None):
+    """Client whose gateway serves ``pages`` in order; records requests."""
+    requests = []
+    responses = iter(pages)
+
+    def handler(request):
+        requests.append(request)
+        page = next(responses)
+        if isinstance(page, Exception):
+            raise page
+        if isinstance(page, int):
+            return httpx.Response(page)
+        if isinstance(page, httpx.Response):
+            return page
+        return httpx.Response(200, json={"entries": page})
+
+    client = AIRClient(AIRConfig())
+    client._http.close()
+    client._http = httpx.Client(base_url="http://air",
+                                transport=httpx.MockTransport(handler))
+    if index is not None:
+        client.audit_index = index
+    return client, requests
+
+
+class TestAuditSince:
+    def test_sends_cursor_and_key(self):
+        client, requests = _gateway_client(
+            [[{"index": 5, "hash": "h5", "prev_hash": "h4"}]],
+            AuditIndex(last_index=4, head_hash="h4"),
+        )
+        result = client.audit_since(gateway_key="secret")
+        assert requests[0].url.path == "/v1/audit/entries"
+        assert requests[0].url.params["after"] == "4"
+        assert requests[0].headers["X-Gateway-Key"] == "secret"
+        assert [e["index"] for e in result] == [5]
+        assert client.audit_index.head_hash == "h5"
+        client.close()
+
+    def test_pages_until_short_page(self):
+        client, requests = _gateway_client(
+            [_chain(0, 2), _chain(2, 4), _chain(4, 5)])
+        result = client.audit_since(limit=2, wait=5)
+        assert [e["index"] for e in result] == [0, 1, 2, 3, 4]
+        assert "after" not in requests[0].url.params
+        assert [r.url.params["after"] for r in requests[1:]] == ["1", "3"]
+        # Long-poll only on the first page
+        assert requests[0].url.params["wait"] == "5"
+        assert "wait" not in requests[1].url.params
+        assert client.audit_index.last_index == 4
+        client.close()
+
+    def test_chain_error_mid_paging_returns_verified_prefix(self):
+        bad = [{"index": 2, "hash": "h2", "prev_hash": "tampered"}]
+        client, requests = _gateway_client([_chain(0, 2), bad, bad])
+        result = client.audit_since(limit=2)
+        assert [e["index"] for e in result] == [0, 1]
+        assert client.audit_index.last_index == 1
+        # The failing page raises next time, leaving the cursor in place
+        with pytest.raises(AuditChainError):
+            client.audit_since(limit=2)
+        assert requests[2].url.params["after"] == "1"
+        assert client.audit_index.last_index == 1
+        client.close()
+
+    def test_transport_error_mid_paging_keeps_progress(self):
+        client, requests = _gateway_client(
+            [_chain(0, 2), httpx.ConnectError("down"), _chain(2, 3)])
+        assert len(client.audit_since(limit=2)) == 2
+        assert client.audit_index.last_index == 1
+        assert [e["index"] for e in client.audit_since(limit=2)] == [2]
+        assert requests[2].url.params["after"] == "1"
+        client.close()
+
+    @pytest.mark.parametrize("response", [
+        httpx.Response(200, json=[1]),
+        httpx.Response(200, json={"entries": None}),
+        httpx.Response(200, text="not json"),
+    ])
+    def test_malformed_response(self, response):
+        client, _ = _gateway_client([response])
+        with pytest.raises(AuditChainError):
+            client.audit_since()
+        assert client.audit_index.last_index == -1
+        client.close()
+
+
+class TestWatch:
+    def test_backoff_doubles_and_caps(self):
+        client, _ = _gateway_client([[], [], [], [], _chain(0, 1)])
+        with patch("air.client.time.sleep") as sleep:
+            entry = next(client.watch(poll_interval=1, max_interval=3))
+        assert entry["index"] == 0
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 3, 3]
+        client.close()
+
+    def test_long_poll_repolls_without_sleeping(self):
+        client, requests = _gateway_client([[], [], _chain(0, 1)])
+        # Each long-poll is held for the full 20s
+        with patch("air.client.time.sleep") as sleep, \
+                patch("air.client.time.monotonic",
+                      side_effect=itertools.count(0, 20)):
+            entry = next(client.watch(wait=20))
+        assert entry["index"] == 0
+        sleep.assert_not_called()
+        assert all(r.url.params["wait"] == "20" for r in requests)
+        client.close()
+
+    def test_long_poll_ignored_falls_back_to_backoff(self):
+        client, _ = _gateway_client([[], [], [], _chain(0, 1)])
+        with patch("air.client.time.sleep") as sleep:
+            entry = next(client.watch(wait=20, poll_interval=1))
+        assert entry["index"] == 0
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 4]
+        client.close()
+
+    def test_early_close_redelivers_rest_of_batch(self):
+        client, requests = _gateway_client([_chain(0, 5), _chain(1, 5)])
+        events = client.watch()
+        assert next(events)["index"] == 0
+        events.close()
+        assert client.audit_index.last_index == 0
+
+        events = client.watch()
+        assert [next(events)["index"] for _ in range(4)] == [1, 2, 3, 4]
+        assert requests[1].url.params["after"] == "0"
+        client.close()
+
+    def test_rate_limit_honours_retry_after(self):
+        client, _ = _gateway_client([
+            httpx.Response(429, headers={"Retry-After": "7"}), _chain(0, 1),
+        ])
+        with patch("air.client.time.sleep") as sleep:
+            entry = next(client.watch(poll_interval=1))
+        assert entry["index"] == 0
+        sleep.assert_called_once_with(7.0)
+        client.close()
+
+    def test_recovers_from_transport_and_5xx_errors(self):
+        client, _ = _gateway_client([
+            httpx.ConnectError("down"), 503, _chain(0, 1), _chain(1, 2),
+        ])
+        with patch("air.client.time.sleep") as sleep:
+            events = client.watch(poll_interval=0.5, wait=20)
+            assert next(events)["index"] == 0
+            assert next(events)["index"] == 1
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+        client.close()
+
+    def test_client_errors_propagate(self):
+        client, _ = _gateway_client([401])
+        with pytest.raises(httpx.HTTPStatusError):
+            next(client.watch())
+        client.close()
+
+
+class TestAuditIndex:
+    def test_extend_verifies_chain(self):
+        index = AuditIndex()
+        assert index.extend(_chain(0, 2)) is None
+        assert len(index) == 2
+        assert 1 in index
+        assert index.last_index == 1
+        assert index.head_hash == "h1"
+
+    def test_extend_rejects_broken_link(self):
+        index = AuditIndex(last_index=0, head_hash="h0")
+        with pytest.raises(AuditChainError):
+            index.extend([
+                {"index": 1, "hash": "h1", "prev_hash": "h0"},
+                {"index": 2, "hash": "h2", "prev_hash": "tampered"},
+            ])
+        # A failed batch leaves the cursor untouched
+        assert index.last_index == 0
+        assert index.head_hash == "h0"
+
+    def test_extend_rejects_gap(self):
+        index = AuditIndex(last_index=0, head_hash="h0")
+        with pytest.raises(AuditChainError):
+            index.extend([{"index": 2, "hash": "h2", "prev_hash": "h0"}])
+
+    def test_extend_requires_genesis_without_cursor(self):
+        with pytest.raises(AuditChainError):
+            AuditIndex().extend([{"index": 7, "hash": "h7"}])
+
+    @pytest.mark.parametrize("entry", [
+        {"hash": "h0"}, {"index": 0}, {"index": "0", "hash": "h0"}, None,
+    ])
+    def test_extend_rejects_malformed_entry(self, entry):
+        with pytest.raises(AuditChainError):
+            AuditIndex().extend([entry])
+
+    def test_seeded_cursor_needs_hash(self):
+        with pytest.raises(ValueError):
+            AuditIndex(last_index=10)
+
+    def test_window_bounds_cache(self):
+        index = AuditIndex(window=3)
+        index.extend(_chain(0, 5))
+        index.extend(_chain(5, 7))
+        assert sorted(index.hashes) == [4, 5, 6]
+        assert 0 not in index
+        assert index.last_index == 6